@@ -5,6 +5,8 @@ from typing import Dict, List, Tuple, Union
 from scipy import stats
 import warnings
 
+from src.data.compact_storage import QuantizedArray
+
 class CDFAnalyzer:
     """
     Comprehensive CDF analysis for A/B testing data
@@ -18,16 +20,20 @@ class CDFAnalyzer:
         Calculate CDF for a given dataset
         
         Args:
-            data: Array of numerical values
+            data: Array of numerical values (float64, float32 or QuantizedArray)
             
         Returns:
-            sorted_data: Sorted values
+            sorted_data: Sorted values, float32 input stays float32
             cdf_values: Corresponding CDF values
         """
         if len(data) == 0:
             raise ValueError("Data cannot be empty")
             
-        sorted_data = np.sort(data)
+        if isinstance(data, QuantizedArray):
+            # Sorting the integer codes is cheaper than sorting decoded floats
+            sorted_data = data.sorted().decode()
+        else:
+            sorted_data = np.sort(data)
         cdf_values = np.arange(1, len(sorted_data) + 1) / len(sorted_data)
         
         return sorted_data, cdf_values
@@ -35,11 +41,18 @@ class CDFAnalyzer:
     def compare_variants(self, variant_a: np.ndarray, variant_b: np.ndarray) -> Dict:
         """
         Comprehensive comparison of two variants using CDF analysis
+        
+        Variants may use compact storage (see src.data.compact_storage);
+        moments are always accumulated in float64.
         """
         # Calculate CDFs
         sorted_a, cdf_a = self.calculate_cdf(variant_a)
         sorted_b, cdf_b = self.calculate_cdf(variant_b)
         
+        # Sorted arrays carry the same values, so reuse them instead of
+        # decoding compact inputs a second time
+        variant_a, variant_b = sorted_a, sorted_b
+        
         # Statistical tests
         ks_stat, ks_pvalue = stats.ks_2samp(variant_a, variant_b)
         mw_stat, mw_pvalue = stats.mannwhitneyu(variant_a, variant_b, alternative='two-sided')
@@ -82,4 +95,6 @@ class CDFAnalyzer:
     
     def _calculate_effect_size(self, a: np.ndarray, b: np.ndarray) -> float:
         """Calculate Cohen's d effect size"""
-        return (np.mean(b) - np.mean(a)) / np.sqrt((np.std(a, ddof=1)**2 + np.std(b, ddof=1)**2) / 2)
\ No newline at end of file
+        mean_a, mean_b = np.mean(a, dtype=np.float64), np.mean(b, dtype=np.float64)
+        var_a, var_b = np.var(a, ddof=1, dtype=np.float64), np.var(b, ddof=1, dtype=np.float64)
+        return (mean_b - mean_a) / np.sqrt((var_a + var_b) / 2)
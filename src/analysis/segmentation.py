@@ -2,6 +2,8 @@
 import numpy as np
 import pandas as pd
 
+from src.data.compact_storage import CompactStorage
+
 class SegmentationAnalyzer:
     """Analyze A/B test results across different user segments"""
     
@@ -25,19 +27,23 @@ class SegmentationAnalyzer:
         """Generate data for specific segments with different characteristics"""
         if len(base_data) == 0:
             return np.array([])
+        
+        # Thresholds are computed on float64 values; selections keep the
+        # storage mode (float32 / quantized) of the base data
+        values = CompactStorage.expand(base_data)
             
         if segment == 'new_users':
             # New users typically have shorter sessions
-            filtered_data = base_data[base_data < np.percentile(base_data, 40)]
+            filtered_data = base_data[values < np.percentile(values, 40)]
             return filtered_data[:size] if len(filtered_data) > 0 else base_data[:size]
         elif segment == 'returning_users':
             # Returning users have longer sessions
-            filtered_data = base_data[base_data > np.percentile(base_data, 60)]
+            filtered_data = base_data[values > np.percentile(values, 60)]
             return filtered_data[:size] if len(filtered_data) > 0 else base_data[:size]
         elif segment == 'mobile_users':
             # Mobile users might have different patterns - FIXED BROADCASTING
             multiplier = np.random.uniform(0.8, 1.2, size)
-            return base_data[:size] * multiplier
+            return CompactStorage.like(base_data).compact(values[:size] * multiplier)
         else:  # desktop_users
             return base_data[:size]
     
@@ -50,7 +56,9 @@ class SegmentationAnalyzer:
                 results = analyzer.compare_variants(data['A'], data['B'])
                 
                 # Calculate segment-specific metrics
-                improvement = (np.median(data['B']) - np.median(data['A'])) / np.median(data['A'])
+                median_a = np.median(CompactStorage.expand(data['A']))
+                median_b = np.median(CompactStorage.expand(data['B']))
+                improvement = (median_b - median_a) / median_a
                 
                 segment_results[segment] = {
                     'analysis': results,
@@ -0,0 +1,255 @@
+# src/analysis/time_windows.py
+import math
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+from scipy import stats
+
+try:
+    # Exact KS p-value from a known D; the same routine ks_2samp uses internally
+    from scipy.stats._stats_py import _attempt_exact_2kssamp
+except ImportError:  # pragma: no cover - layout of older/newer scipy releases
+    _attempt_exact_2kssamp = None
+
+# ks_2samp(method='auto') is exact up to this sample size
+KS_EXACT_MAX_N = 10000
+
+
+def _merge_sorted(left: np.ndarray, right: np.ndarray):
+    """Linear merge of two sorted arrays; also returns a mask of elements taken from right"""
+    positions = np.searchsorted(left, right, side='right') + np.arange(len(right))
+    merged = np.empty(len(left) + len(right), dtype=np.float64)
+    from_right = np.zeros(len(merged), dtype=bool)
+    from_right[positions] = True
+    merged[from_right] = right
+    merged[~from_right] = left
+    return merged, from_right
+
+
+def _ks_p_value(d: float, n_a: int, n_b: int) -> float:
+    """Two-sided KS p-value for a known D, following ks_2samp(method='auto')"""
+    if max(n_a, n_b) <= KS_EXACT_MAX_N:
+        success, _, prob = _attempt_exact_2kssamp(n_a, n_b, math.gcd(n_a, n_b), d, 'two-sided')
+        if success:
+            return float(np.clip(prob, 0, 1))
+    return float(np.clip(stats.kstwo.sf(d, np.round(n_a * n_b / (n_a + n_b))), 0, 1))
+
+
+def sorted_two_sample_tests(sorted_a: np.ndarray, sorted_b: np.ndarray) -> Dict:
+    """
+    KS and Mann-Whitney tests on two already sorted samples without re-sorting.
+
+    Both statistics come from one linear merge of the samples: D from the
+    ECDFs at the end of each run of tied values, U from the run midranks.
+    P-values match scipy's defaults: the KS p-value is exact up to 10000
+    values per sample and uses kstwo above that; MW uses the tie-corrected
+    normal approximation with continuity correction. Samples with 8 or
+    fewer values, or a scipy without the exact KS routine, are handed to
+    scipy directly.
+    """
+    n_a, n_b = len(sorted_a), len(sorted_b)
+    if min(n_a, n_b) <= 8 or _attempt_exact_2kssamp is None:
+        ks_stat, ks_pvalue = stats.ks_2samp(sorted_a, sorted_b)
+        mw_stat, mw_pvalue = stats.mannwhitneyu(sorted_a, sorted_b, alternative='two-sided')
+        return {'ks_statistic': ks_stat, 'ks_p_value': ks_pvalue,
+                'mw_statistic': mw_stat, 'mw_p_value': mw_pvalue}
+
+    pooled, from_b = _merge_sorted(sorted_a, sorted_b)
+    n = n_a + n_b
+    run_starts = np.flatnonzero(np.r_[True, pooled[1:] != pooled[:-1]])
+    run_lengths = np.diff(np.r_[run_starts, n])
+    a_in_run = np.add.reduceat((~from_b).astype(np.int64), run_starts)
+
+    # KS: ECDF gap evaluated after each run of tied values
+    cdf_gap = np.cumsum(a_in_run) / n_a - np.cumsum(run_lengths - a_in_run) / n_b
+    ks_stat = float(np.max(np.abs(cdf_gap)))
+    ks_pvalue = _ks_p_value(ks_stat, n_a, n_b)
+
+    # MW: tied values share the midrank of their run
+    midranks = run_starts + (run_lengths + 1) / 2
+    mw_stat = float(np.dot(a_in_run, midranks) - n_a * (n_a + 1) / 2)
+    tie_term = np.sum(run_lengths.astype(np.float64) ** 3 - run_lengths)
+    sigma = np.sqrt(n_a * n_b / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    u_max = max(mw_stat, n_a * n_b - mw_stat)
+    z = (u_max - n_a * n_b / 2 - 0.5) / sigma if sigma > 0 else 0.0
+    mw_pvalue = float(np.clip(2 * stats.norm.sf(z), 0, 1))
+
+    return {'ks_statistic': ks_stat, 'ks_p_value': ks_pvalue,
+            'mw_statistic': mw_stat, 'mw_p_value': mw_pvalue}
+
+
+class SortedWindow:
+    """
+    Sorted multiset of one variant's values inside a sliding window.
+
+    Days enter and leave as pre-sorted blocks, so the window is updated with
+    a linear merge / delete instead of re-sorting everything. Shifted sums
+    are kept alongside for float64 mean and variance.
+    """
+
+    def __init__(self):
+        self.values = np.array([], dtype=np.float64)
+        self._shift = None
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, day_values: np.ndarray):
+        """Merge a sorted block of values into the window"""
+        if len(day_values) == 0:
+            return
+        if self._shift is None:
+            self._shift = float(day_values[len(day_values) // 2])
+
+        self.values, _ = _merge_sorted(self.values, day_values)
+
+        shifted = day_values - self._shift
+        self._sum += shifted.sum()
+        self._sum_sq += np.dot(shifted, shifted)
+
+    def remove(self, day_values: np.ndarray):
+        """Remove a sorted block of values previously added to the window"""
+        if len(day_values) == 0:
+            return
+        # Offset repeated values so each copy removes a distinct element
+        duplicate_rank = np.arange(len(day_values)) - np.searchsorted(day_values, day_values, side='left')
+        positions = np.searchsorted(self.values, day_values, side='left') + duplicate_rank
+        self.values = np.delete(self.values, positions)
+
+        shifted = day_values - self._shift
+        self._sum -= shifted.sum()
+        self._sum_sq -= np.dot(shifted, shifted)
+        if len(self.values) == 0:
+            self._shift, self._sum, self._sum_sq = None, 0.0, 0.0
+
+    def mean(self) -> float:
+        return self._shift + self._sum / len(self.values)
+
+    def var(self) -> float:
+        n = len(self.values)
+        return max(self._sum_sq - self._sum ** 2 / n, 0.0) / (n - 1)
+
+    def percentiles(self, q: List[float]) -> np.ndarray:
+        """Linear-interpolated percentiles (same as np.percentile) on sorted values"""
+        position = np.asarray(q, dtype=np.float64) / 100 * (len(self.values) - 1)
+        lower = np.floor(position).astype(int)
+        upper = np.minimum(lower + 1, len(self.values) - 1)
+        fraction = position - lower
+        return self.values[lower] + (self.values[upper] - self.values[lower]) * fraction
+
+
+class TimeWindowAnalyzer:
+    """
+    Sliding time-window CDF analysis for timestamped A/B test observations.
+
+    Produces one row per window with KS, Mann-Whitney, percentile and
+    effect-size results, e.g. daily (window_days=1) or rolling 7-day series
+    to track novelty effects over the course of a test. All statistics are
+    computed from the incrementally maintained sorted windows.
+    """
+
+    def __init__(self, window_days: int = 7, step_days: int = 1,
+                 percentiles: Tuple[int, ...] = (10, 25, 50, 75, 90)):
+        if window_days < 1 or step_days < 1:
+            raise ValueError("window_days and step_days must be at least 1")
+        self.window_days = window_days
+        self.step_days = step_days
+        self.percentiles = list(percentiles)
+
+    def table_columns(self) -> List[str]:
+        """Column order of the table returned by analyze"""
+        columns = ['window_start', 'window_end', 'size_a', 'size_b', 'ks_statistic', 'ks_p_value',
+                   'mw_statistic', 'mw_p_value', 'effect_size']
+        for q in self.percentiles:
+            columns += [f'p{q}_a', f'p{q}_b']
+        return columns
+
+    def split_by_day(self, observations: pd.DataFrame,
+                     timestamp_column: str = 'timestamp',
+                     variant_column: str = 'variant',
+                     metric_column: str = 'value',
+                     control_value: str = 'A',
+                     treatment_value: str = 'B') -> Dict:
+        """Group observations into sorted per-day arrays for each variant"""
+        missing_cols = [col for col in (timestamp_column, variant_column, metric_column)
+                        if col not in observations.columns]
+        if missing_cols:
+            raise ValueError(f"Missing columns in observations: {missing_cols}")
+
+        df = observations[[timestamp_column, variant_column, metric_column]].dropna()
+        days = pd.to_datetime(df[timestamp_column]).dt.floor('D')
+
+        daily = {}
+        for variant_key, variant_value in (('A', control_value), ('B', treatment_value)):
+            mask = (df[variant_column] == variant_value).values
+            grouped = df.loc[mask, metric_column].astype(np.float64).groupby(days[mask].values)
+            daily[variant_key] = {day: np.sort(values.values) for day, values in grouped}
+
+        if not daily['A'] or not daily['B']:
+            raise ValueError("Both variants need at least one timestamped observation")
+        return daily
+
+    def analyze(self, observations: pd.DataFrame, **columns) -> pd.DataFrame:
+        """
+        Run the windowed comparison and return a time-series table.
+
+        Keyword arguments are forwarded to split_by_day to select columns
+        and variant labels. Windows where a variant has fewer than two
+        observations get NaN statistics. If the data spans fewer days than
+        window_days, the table is empty but keeps its columns.
+        """
+        daily = self.split_by_day(observations, **columns)
+        all_days = sorted(set(daily['A']) | set(daily['B']))
+        calendar = pd.date_range(all_days[0], all_days[-1], freq='D')
+        empty = np.array([], dtype=np.float64)
+
+        windows = {'A': SortedWindow(), 'B': SortedWindow()}
+        rows = []
+        start = 0  # index into calendar of the first day currently in the window
+        end = -1   # index of the last day currently in the window
+
+        for window_end in range(self.window_days - 1, len(calendar), self.step_days):
+            window_start = window_end - self.window_days + 1
+
+            # Slide: drop days that left, add days that entered
+            for day_index in range(start, min(window_start, end + 1)):
+                for key, window in windows.items():
+                    window.remove(daily[key].get(calendar[day_index], empty))
+            for day_index in range(max(end + 1, window_start), window_end + 1):
+                for key, window in windows.items():
+                    window.add(daily[key].get(calendar[day_index], empty))
+            start, end = window_start, window_end
+
+            rows.append(self._window_row(calendar[window_start], calendar[window_end],
+                                         windows['A'], windows['B']))
+
+        return pd.DataFrame(rows, columns=self.table_columns())
+
+    def _window_row(self, window_start, window_end, window_a: SortedWindow,
+                    window_b: SortedWindow) -> Dict:
+        """Compute the comparison statistics for one window"""
+        row = {
+            'window_start': window_start,
+            'window_end': window_end,
+            'size_a': len(window_a),
+            'size_b': len(window_b),
+        }
+
+        if len(window_a) < 2 or len(window_b) < 2:
+            for name in ('ks_statistic', 'ks_p_value', 'mw_statistic', 'mw_p_value', 'effect_size'):
+                row[name] = np.nan
+            for q in self.percentiles:
+                row[f'p{q}_a'] = row[f'p{q}_b'] = np.nan
+            return row
+
+        row.update(sorted_two_sample_tests(window_a.values, window_b.values))
+        row['effect_size'] = (window_b.mean() - window_a.mean()) / np.sqrt((window_a.var() + window_b.var()) / 2)
+
+        for q, value_a, value_b in zip(self.percentiles, window_a.percentiles(self.percentiles),
+                                       window_b.percentiles(self.percentiles)):
+            row[f'p{q}_a'] = value_a
+            row[f'p{q}_b'] = value_b
+
+        return row
@@ -0,0 +1,137 @@
+# src/data/compact_storage.py
+import numpy as np
+from typing import Optional, Union
+
+FLOAT32_RELATIVE_ERROR = 2.0 ** -24
+# Largest code range that float64 decoding represents exactly
+MAX_QUANTIZED_CODE = 2 ** 53
+
+
+class QuantizedArray:
+    """
+    Metric values stored as unsigned integer codes on a fixed resolution grid.
+
+    value = offset + code * resolution. Every stored value is within
+    resolution / 2 of the original, and sorting the codes sorts the values.
+    The value range may span at most 2**53 resolution steps.
+    """
+
+    def __init__(self, codes: np.ndarray, resolution: float, offset: float = 0.0):
+        self.codes = codes
+        self.resolution = float(resolution)
+        self.offset = float(offset)
+
+    @classmethod
+    def from_values(cls, data: np.ndarray, resolution: float) -> 'QuantizedArray':
+        """Quantize float values to the given resolution"""
+        if resolution <= 0:
+            raise ValueError("Resolution must be positive")
+
+        values = np.asarray(data, dtype=np.float64)
+        if not np.all(np.isfinite(values)):
+            raise ValueError("Cannot quantize NaN or infinite values")
+        if len(values) == 0:
+            return cls(np.array([], dtype=np.uint8), resolution)
+
+        # Anchor the grid on a multiple of the resolution so offsets stay exact
+        offset = np.floor(values.min() / resolution) * resolution
+        codes = np.rint((values - offset) / resolution)
+        if codes.max() > MAX_QUANTIZED_CODE:
+            raise ValueError(
+                f"Value range {values.max() - values.min():g} is too wide for resolution {resolution:g}; "
+                f"quantized codes would exceed 2**53 and lose the resolution / 2 error bound"
+            )
+        code_dtype = np.min_scalar_type(int(codes.max()))
+        return cls(codes.astype(code_dtype), resolution, offset)
+
+    def decode(self) -> np.ndarray:
+        """Return the values as a float64 array"""
+        return self.offset + self.codes.astype(np.float64) * self.resolution
+
+    def sorted(self) -> 'QuantizedArray':
+        """Return a copy with codes in ascending order"""
+        return QuantizedArray(np.sort(self.codes), self.resolution, self.offset)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes
+
+    @property
+    def max_abs_error(self) -> float:
+        """Upper bound on |stored - original| for any element"""
+        return self.resolution / 2
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, key):
+        selected = self.codes[key]
+        if np.ndim(selected) == 0:
+            return self.offset + float(selected) * self.resolution
+        return QuantizedArray(selected, self.resolution, self.offset)
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.decode()
+        return values if dtype is None else values.astype(dtype)
+
+    def __repr__(self) -> str:
+        return (f"QuantizedArray(n={len(self)}, resolution={self.resolution}, "
+                f"dtype={self.codes.dtype})")
+
+
+class CompactStorage:
+    """
+    Opt-in reduced-precision storage for variant arrays.
+
+    Modes:
+        'float64':   full precision (no-op)
+        'float32':   half the memory, relative error <= 2**-24 per value
+        'quantized': integer codes at a declared resolution, absolute
+                     error <= resolution / 2 per value
+
+    Percentiles, medians and means computed from compact data inherit the
+    same per-value bound. KS and Mann-Whitney statistics can only change
+    where values from the two variants lie within that bound of each other.
+    """
+
+    MODES = ('float64', 'float32', 'quantized')
+
+    def __init__(self, mode: str = 'float32', resolution: Optional[float] = None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported storage mode '{mode}'. Expected one of: {self.MODES}")
+        if mode == 'quantized' and (resolution is None or resolution <= 0):
+            raise ValueError("Quantized storage requires a positive resolution")
+
+        self.mode = mode
+        self.resolution = resolution
+
+    def compact(self, data: np.ndarray) -> Union[np.ndarray, QuantizedArray]:
+        """Convert a metric array to this storage representation"""
+        if self.mode == 'quantized':
+            return QuantizedArray.from_values(self.expand(data), self.resolution)
+        return np.asarray(self.expand(data), dtype=self.mode)
+
+    def error_bound(self, data: Union[np.ndarray, QuantizedArray]) -> float:
+        """Worst-case absolute error per value when storing data in this mode"""
+        if self.mode == 'quantized':
+            return self.resolution / 2
+        if self.mode == 'float32':
+            values = self.expand(data)
+            return float(np.max(np.abs(values))) * FLOAT32_RELATIVE_ERROR if len(values) else 0.0
+        return 0.0
+
+    @staticmethod
+    def expand(data: Union[np.ndarray, QuantizedArray]) -> np.ndarray:
+        """Return data as a float64 array regardless of its storage mode"""
+        if isinstance(data, QuantizedArray):
+            return data.decode()
+        return np.asarray(data, dtype=np.float64)
+
+    @staticmethod
+    def like(data: Union[np.ndarray, QuantizedArray]) -> 'CompactStorage':
+        """Return the storage that produced the given array"""
+        if isinstance(data, QuantizedArray):
+            return CompactStorage('quantized', data.resolution)
+        if np.asarray(data).dtype == np.float32:
+            return CompactStorage('float32')
+        return CompactStorage('float64')
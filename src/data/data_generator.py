@@ -1,7 +1,9 @@
 # src/data/data_generator.py
 import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, Optional
+
+from src.data.compact_storage import CompactStorage
 
 class ABTestDataGenerator:
     """Generate realistic A/B testing data for demonstration"""
@@ -30,9 +32,9 @@ class ABTestDataGenerator:
             return np.random.lognormal(4.2, 0.7, n_samples)  # Faster conversions
     
     @staticmethod
-    def create_sample_dataset() -> Dict:
+    def create_sample_dataset(storage: Optional[CompactStorage] = None) -> Dict:
         """Create a complete sample dataset for demonstration"""
-        return {
+        dataset = {
             'session_duration': {
                 'A': ABTestDataGenerator.generate_session_durations('A', 1500),
                 'B': ABTestDataGenerator.generate_session_durations('B', 1500)
@@ -45,4 +47,12 @@ class ABTestDataGenerator:
                 'A': np.random.exponential(2.5, 2000),
                 'B': np.random.exponential(2.0, 2000)
             }
-        }
\ No newline at end of file
+        }
+        
+        if storage is not None:
+            dataset = {
+                metric: {variant: storage.compact(values) for variant, values in variants.items()}
+                for metric, variants in dataset.items()
+            }
+        
+        return dataset
@@ -6,6 +6,9 @@ from typing import Dict, List, Optional, Union
 from pathlib import Path
 import warnings
 
+from src.data.compact_storage import CompactStorage
+from src.data.sharded_importers import ShardedImporter
+
 class DataImporters:
     """
     Import and convert real-world A/B testing data from various sources
@@ -13,7 +16,7 @@ class DataImporters:
     """
     
     def __init__(self):
-        self.supported_sources = ['google_analytics', 'optimizely', 'amplitude', 'mixpanel', 'csv']
+        self.supported_sources = ['google_analytics', 'optimizely', 'amplitude', 'mixpanel', 'csv', 'partitioned_csv']
     
     def validate_data_structure(self, data: Dict, source: str) -> bool:
         """Validate that imported data has the correct structure"""
@@ -35,9 +38,13 @@ class DataImporters:
                       variant_column: str,
                       metric_column: str,
                       control_value: str = 'A',
-                      treatment_value: str = 'B') -> Dict:
+                      treatment_value: str = 'B',
+                      storage: Optional[CompactStorage] = None) -> Dict:
         """
         Import A/B test data from CSV file
+        
+        Pass a CompactStorage to keep the variant arrays in float32 or
+        quantized form; cleaning always runs on the full-precision values.
         """
         try:
             if not Path(file_path).exists():
@@ -64,12 +71,17 @@ class DataImporters:
             control_data = self._clean_metric_data(control_data)
             treatment_data = self._clean_metric_data(treatment_data)
             
+            if storage is not None:
+                control_data = storage.compact(control_data)
+                treatment_data = storage.compact(treatment_data)
+            
             result = {
                 'variant_a': control_data,
                 'variant_b': treatment_data,
                 'metric_name': metric_column,
                 'source': 'csv',
                 'file_path': file_path,
+                'storage': storage.mode if storage is not None else 'float64',
                 'sample_sizes': {
                     'control': len(control_data),
                     'treatment': len(treatment_data)
@@ -86,6 +98,32 @@ class DataImporters:
         except Exception as e:
             raise ValueError(f"Error importing CSV data: {str(e)}")
 
+    def import_from_partitions(self, source: str,
+                             variant_column: str,
+                             metric_column: str,
+                             control_value: str = 'A',
+                             treatment_value: str = 'B',
+                             pattern: str = '*.csv',
+                             max_workers: Optional[int] = None,
+                             storage: Optional[CompactStorage] = None) -> Dict:
+        """
+        Import A/B test data partitioned across many CSV files
+        
+        source is a directory (searched recursively for pattern) or a glob.
+        Partitions are aggregated in parallel by ShardedImporter and merged
+        into exact variant arrays.
+        """
+        try:
+            result = ShardedImporter(max_workers).import_partitions(
+                source, variant_column, metric_column, control_value, treatment_value,
+                pattern=pattern, storage=storage
+            )
+            self.validate_data_structure(result, 'partitioned_csv')
+            return result
+            
+        except Exception as e:
+            raise ValueError(f"Error importing partitioned data: {str(e)}")
+
     def _clean_metric_data(self, data: np.ndarray, 
                          outlier_threshold: float = 3.0) -> np.ndarray:
         """
@@ -111,8 +149,8 @@ class DataImporters:
 
     def get_import_summary(self, imported_data: Dict) -> str:
         """Generate a summary of imported data"""
-        control_mean = np.mean(imported_data['variant_a']) if len(imported_data['variant_a']) > 0 else 0
-        treatment_mean = np.mean(imported_data['variant_b']) if len(imported_data['variant_b']) > 0 else 0
+        control_mean = np.mean(CompactStorage.expand(imported_data['variant_a'])) if len(imported_data['variant_a']) > 0 else 0
+        treatment_mean = np.mean(CompactStorage.expand(imported_data['variant_b'])) if len(imported_data['variant_b']) > 0 else 0
         
         summary = f"""
  Data Import Summary
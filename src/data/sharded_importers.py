@@ -0,0 +1,279 @@
+# src/data/sharded_importers.py
+import glob
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.data.compact_storage import CompactStorage
+
+SPLITTER_SAMPLE_SIZE = 256
+
+
+class PartialAggregate:
+    """
+    Exact summary of one variant's values from one or more shards.
+
+    Stores a sorted value-count table (a run-length encoded sorted run) plus
+    count / mean / M2 moments. Tables covering disjoint, ordered value
+    ranges can be concatenated without re-sorting.
+    """
+
+    def __init__(self, values: np.ndarray, counts: np.ndarray):
+        self.values = values
+        self.counts = counts
+        self.n = int(counts.sum())
+        if self.n > 0:
+            self.mean = float(np.dot(values, counts) / self.n)
+            self.m2 = float(np.dot((values - self.mean) ** 2, counts))
+        else:
+            self.mean, self.m2 = 0.0, 0.0
+
+    @classmethod
+    def from_values(cls, data: np.ndarray) -> 'PartialAggregate':
+        values, counts = np.unique(np.asarray(data, dtype=np.float64), return_counts=True)
+        return cls(values, counts.astype(np.int64))
+
+    @classmethod
+    def from_sorted_runs(cls, values: np.ndarray, counts: np.ndarray) -> 'PartialAggregate':
+        """Build a table from several concatenated sorted value-count runs"""
+        # Stable sort is timsort for floats, which merges the pre-sorted runs
+        order = np.argsort(values, kind='stable')
+        values, counts = values[order], counts[order]
+        if len(values) == 0:
+            return cls(values, counts)
+
+        # Collapse values present in more than one run
+        run_starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+        return cls(values[run_starts], np.add.reduceat(counts, run_starts))
+
+    @staticmethod
+    def concatenate(parts: List['PartialAggregate']) -> 'PartialAggregate':
+        """Join tables of disjoint value ranges given in ascending order"""
+        combined = PartialAggregate.__new__(PartialAggregate)
+        combined.values = np.concatenate([part.values for part in parts])
+        combined.counts = np.concatenate([part.counts for part in parts])
+        combined.n, combined.mean, combined.m2 = 0, 0.0, 0.0
+
+        # Chan et al. parallel moment update
+        for part in parts:
+            total = combined.n + part.n
+            if part.n == 0:
+                continue
+            delta = part.mean - combined.mean
+            combined.mean += delta * part.n / total
+            combined.m2 += part.m2 + delta ** 2 * combined.n * part.n / total
+            combined.n = total
+        return combined
+
+    def order_statistic(self, k: np.ndarray) -> np.ndarray:
+        """Values at zero-based ranks k of the expanded sorted data"""
+        return self.values[np.searchsorted(np.cumsum(self.counts), k, side='right')]
+
+    def percentile(self, q: float) -> float:
+        """Linear-interpolated percentile, equivalent to np.percentile on the expanded data"""
+        position = q / 100 * (self.n - 1)
+        lower = int(np.floor(position))
+        low_value, high_value = self.order_statistic(np.array([lower, min(lower + 1, self.n - 1)]))
+        return float(np.percentile([low_value, high_value], (position - lower) * 100))
+
+    def filter_range(self, lower_bound: float, upper_bound: float) -> 'PartialAggregate':
+        keep = (self.values >= lower_bound) & (self.values <= upper_bound)
+        return PartialAggregate(self.values[keep], self.counts[keep])
+
+    def expand(self) -> np.ndarray:
+        """Sorted float64 array with every observation, ready for CDFAnalyzer"""
+        return np.repeat(self.values, self.counts)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else float('nan')
+
+
+def _map_partition(file_path: str, spill_prefix: str, variant_column: str, metric_column: str,
+                   control_value: str, treatment_value: str) -> Dict:
+    """
+    Worker: aggregate one partition and spill its sorted tables to disk
+
+    Only file paths, row counts and a small order-statistic sample travel
+    back to the parent.
+    """
+    df = pd.read_csv(file_path)
+    missing_cols = [col for col in (variant_column, metric_column) if col not in df.columns]
+    if missing_cols:
+        raise ValueError(f"Missing columns in partition {file_path}: {missing_cols}")
+
+    summary = {'rows': {}}
+    for key, variant_value in (('A', control_value), ('B', treatment_value)):
+        variant_values = df.loc[df[variant_column] == variant_value, metric_column]
+        aggregate = PartialAggregate.from_values(variant_values.dropna().values)
+
+        table_paths = (f'{spill_prefix}.{key}.values.npy', f'{spill_prefix}.{key}.counts.npy')
+        np.save(table_paths[0], aggregate.values)
+        np.save(table_paths[1], aggregate.counts)
+
+        sample_ranks = np.linspace(0, aggregate.n - 1, min(SPLITTER_SAMPLE_SIZE, aggregate.n))
+        summary['rows'][key] = len(variant_values)
+        summary[key] = {
+            'tables': table_paths,
+            'n': aggregate.n,
+            'sample': aggregate.order_statistic(sample_ranks.astype(np.int64)),
+        }
+    return summary
+
+
+def _reduce_range(tables: List[Tuple[str, str]], lower: float, upper: float) -> PartialAggregate:
+    """Worker: merge the slice (lower, upper] of every partition's sorted table"""
+    values, counts = [], []
+    for values_path, counts_path in tables:
+        table_values = np.load(values_path, mmap_mode='r')
+        start = np.searchsorted(table_values, lower, side='right')
+        end = np.searchsorted(table_values, upper, side='right')
+        values.append(np.array(table_values[start:end]))
+        counts.append(np.array(np.load(counts_path, mmap_mode='r')[start:end]))
+    return PartialAggregate.from_sorted_runs(np.concatenate(values), np.concatenate(counts))
+
+
+class ShardedImporter:
+    """
+    Map-reduce import of A/B test data spread across partitioned CSV files.
+
+    Map: each partition is aggregated in a worker process into sorted
+    value-count tables, which are spilled to a scratch directory.
+    Reduce: splitters taken from sampled order statistics cut the value axis
+    into ranges, and each worker merges one range across all partitions.
+
+    The parent only joins the per-range tables in order and expands them
+    into the final arrays. That is a single O(N) copy, needed because
+    CDFAnalyzer takes in-memory arrays.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    @staticmethod
+    def resolve_partitions(source: str, pattern: str = '*.csv') -> List[str]:
+        """Expand a directory (matched recursively against pattern) or a glob into file paths"""
+        if Path(source).is_dir():
+            files = [str(path) for path in Path(source).rglob(pattern) if path.is_file()]
+        else:
+            files = glob.glob(source, recursive=True)
+
+        if not files:
+            raise FileNotFoundError(f"No partitions found for: {source}")
+        return sorted(files)
+
+    def aggregate_partitions(self, files: List[str], variant_column: str, metric_column: str,
+                             control_value: str = 'A', treatment_value: str = 'B') -> Dict:
+        """Map every partition to sorted tables and merge them by value range"""
+        with tempfile.TemporaryDirectory(prefix='ab_shards_') as spill_dir:
+            spill_prefixes = [os.path.join(spill_dir, str(index)) for index in range(len(files))]
+            map_args = [[arg] * len(files) for arg in
+                        (variant_column, metric_column, control_value, treatment_value)]
+
+            if self.max_workers == 1:
+                summaries = list(map(_map_partition, files, spill_prefixes, *map_args))
+                return self._reduce(summaries, map)
+
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                chunksize = max(1, len(files) // (self.max_workers * 4))
+                summaries = list(executor.map(_map_partition, files, spill_prefixes, *map_args,
+                                              chunksize=chunksize))
+                return self._reduce(summaries, executor.map)
+
+    def _reduce(self, summaries: List[Dict], mapper) -> Dict:
+        """Range-partitioned merge of the spilled tables for each variant"""
+        merged = {'rows': {key: sum(summary['rows'][key] for summary in summaries) for key in ('A', 'B')}}
+
+        for key in ('A', 'B'):
+            shards = [summary[key] for summary in summaries if summary[key]['n'] > 0]
+            if not shards:
+                merged[key] = PartialAggregate(np.array([], dtype=np.float64), np.array([], dtype=np.int64))
+                continue
+
+            splitters = self._choose_splitters(shards, self.max_workers * 2)
+            bounds = np.r_[-np.inf, splitters, np.inf]
+            tables = [shard['tables'] for shard in shards]
+
+            parts = list(mapper(_reduce_range, [tables] * (len(bounds) - 1), bounds[:-1], bounds[1:]))
+            merged[key] = PartialAggregate.concatenate(parts)
+        return merged
+
+    @staticmethod
+    def _choose_splitters(shards: List[Dict], n_ranges: int) -> np.ndarray:
+        """Approximate equal-count value splitters from each shard's order-statistic sample"""
+        if not shards or n_ranges <= 1:
+            return np.array([], dtype=np.float64)
+
+        samples = np.concatenate([shard['sample'] for shard in shards])
+        # Each sample point stands for an equal share of its shard's values
+        weights = np.concatenate([np.full(len(shard['sample']), shard['n'] / len(shard['sample']))
+                                  for shard in shards])
+        order = np.argsort(samples)
+        cumulative = np.cumsum(weights[order])
+        targets = cumulative[-1] * np.arange(1, n_ranges) / n_ranges
+        return np.unique(samples[order][np.searchsorted(cumulative, targets)])
+
+    def import_partitions(self, source: str, variant_column: str, metric_column: str,
+                          control_value: str = 'A', treatment_value: str = 'B',
+                          pattern: str = '*.csv', clean: bool = True,
+                          outlier_threshold: float = 3.0,
+                          storage: Optional[CompactStorage] = None) -> Dict:
+        """
+        Import partitioned A/B test data into the same format as DataImporters.import_from_csv
+
+        Outlier cleaning uses the same IQR rule, evaluated exactly on the
+        merged value-count tables. Variant arrays are returned sorted.
+        """
+        files = self.resolve_partitions(source, pattern)
+        merged = self.aggregate_partitions(files, variant_column, metric_column,
+                                           control_value, treatment_value)
+
+        aggregates = {}
+        for key, variant_value in (('A', control_value), ('B', treatment_value)):
+            aggregate = merged[key]
+            if aggregate.n == 0:
+                raise ValueError(f"No data found for variant '{variant_value}'")
+            aggregates[key] = self._clean_aggregate(aggregate, outlier_threshold) if clean else aggregate
+
+        control_data = aggregates['A'].expand()
+        treatment_data = aggregates['B'].expand()
+        if storage is not None:
+            control_data = storage.compact(control_data)
+            treatment_data = storage.compact(treatment_data)
+
+        return {
+            'variant_a': control_data,
+            'variant_b': treatment_data,
+            'metric_name': metric_column,
+            'source': 'partitioned_csv',
+            'file_path': source,
+            'partitions': len(files),
+            'storage': storage.mode if storage is not None else 'float64',
+            'sample_sizes': {
+                'control': aggregates['A'].n,
+                'treatment': aggregates['B'].n
+            },
+            'moments': {
+                'control': {'mean': aggregates['A'].mean, 'variance': aggregates['A'].variance},
+                'treatment': {'mean': aggregates['B'].mean, 'variance': aggregates['B'].variance}
+            },
+            'data_quality': {
+                'control_missing_removed': merged['rows']['A'] - aggregates['A'].n,
+                'treatment_missing_removed': merged['rows']['B'] - aggregates['B'].n
+            }
+        }
+
+    @staticmethod
+    def _clean_aggregate(aggregate: PartialAggregate, outlier_threshold: float) -> PartialAggregate:
+        """Remove extreme outliers using the IQR method (mirrors DataImporters._clean_metric_data)"""
+        if aggregate.n <= 10:  # Only if we have enough data
+            return aggregate
+        
+        Q1 = aggregate.percentile(25)
+        Q3 = aggregate.percentile(75)
+        IQR = Q3 - Q1
+        return aggregate.filter_range(Q1 - outlier_threshold * IQR, Q3 + outlier_threshold * IQR)
@@ -0,0 +1,9 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def variants():
+    """Control / treatment session durations shared across test modules"""
+    rng = np.random.default_rng(42)
+    return rng.exponential(120, 2000), rng.exponential(150, 2000)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from src.analysis.bus_insights import BusinessImpactCalculator
+from src.analysis.cdf_calc import CDFAnalyzer
+
+
+def test_revenue_impact_uses_median_percentile(variants):
+    results = CDFAnalyzer().compare_variants(*variants)
+    impact = BusinessImpactCalculator().calculate_revenue_impact(results)
+
+    median_a, median_b = np.median(variants[0]), np.median(variants[1])
+    expected = min(max((median_b - median_a) / median_a * 0.1, 0), 0.5)
+    assert impact['improvement']['conversion_rate_improvement'] == pytest.approx(expected)
+
+
+def test_distribution_matches_scalar_model():
+    calculator = BusinessImpactCalculator()
+    uplift = np.full(10, 0.2)
+    distribution = calculator.revenue_impact_distribution(uplift)
+    scalar = calculator.calculate_revenue_impact({
+        'percentiles': {'values': [50], 'variant_a': [100.0], 'variant_b': [120.0]}
+    })
+
+    assert distribution['annual_revenue_improvement_quantiles'].shape == (5, 1, 1, 1)
+    np.testing.assert_allclose(distribution['annual_revenue_improvement_quantiles'],
+                               scalar['improvement']['annual_revenue_improvement'])
+
+
+def test_distribution_broadcasts_assumption_grid():
+    calculator = BusinessImpactCalculator()
+    uplift = np.random.default_rng(0).normal(0.1, 0.05, 100000)
+    distribution = calculator.revenue_impact_distribution(
+        uplift, conversion_rate=[0.02, 0.05, 0.08], avg_order_value=[50, 100], daily_users=10000
+    )
+
+    quantiles = distribution['annual_revenue_improvement_quantiles']
+    assert quantiles.shape == (5, 3, 2, 1)
+    assert np.all(np.diff(quantiles, axis=0) >= 0)
+    # Impact scales linearly with conversion rate and order value
+    np.testing.assert_allclose(quantiles[:, 2, 1], quantiles[:, 0, 0] * 4 * 2)
+
+
+@pytest.mark.parametrize('data', [np.array([1.0, 2.0, 3.0, 4.0]), np.array([1.0, 2.0, 3.0, 4.0, 10.0])])
+def test_bootstrap_medians_match_exhaustive_resampling(data):
+    # Enumerate every equally likely resample to get the exact bootstrap mean
+    resamples = np.array(np.meshgrid(*[data] * len(data))).reshape(len(data), -1).T
+    exact_mean = np.median(resamples, axis=1).mean()
+
+    draws = BusinessImpactCalculator._bootstrap_medians(data, 1000000, np.random.default_rng(0))
+    assert draws.mean() == pytest.approx(exact_mean, abs=0.005)
+
+
+def test_bootstrap_median_uplift_matches_resampling(variants):
+    a, b = variants
+    draws = BusinessImpactCalculator.bootstrap_median_uplift(a, b, n_draws=200000, random_state=1)
+
+    rng = np.random.default_rng(2)
+    median_a = np.median(rng.choice(a, (5000, len(a))), axis=1)
+    median_b = np.median(rng.choice(b, (5000, len(b))), axis=1)
+    resampled = (median_b - median_a) / median_a
+    np.testing.assert_allclose(np.quantile(draws, [0.1, 0.5, 0.9]),
+                               np.quantile(resampled, [0.1, 0.5, 0.9]), atol=0.006)
+    assert draws.mean() == pytest.approx(resampled.mean(), abs=0.002)
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from src.analysis.cdf_calc import CDFAnalyzer
+from src.data.compact_storage import CompactStorage, QuantizedArray
+
+
+def test_calculate_cdf_sorted_and_monotonic():
+    sorted_data, cdf = CDFAnalyzer().calculate_cdf(np.array([3.0, 1.0, 2.0]))
+    np.testing.assert_array_equal(sorted_data, [1.0, 2.0, 3.0])
+    np.testing.assert_allclose(cdf, [1 / 3, 2 / 3, 1.0])
+
+
+def test_calculate_cdf_rejects_empty():
+    with pytest.raises(ValueError):
+        CDFAnalyzer().calculate_cdf(np.array([]))
+
+
+def test_quantized_error_bound(variants):
+    data = variants[0]
+    quantized = QuantizedArray.from_values(data, resolution=0.001)
+    assert np.max(np.abs(quantized.decode() - data)) <= quantized.max_abs_error + 1e-9
+    assert quantized.nbytes < data.nbytes
+
+
+def test_float32_error_bound(variants):
+    data = variants[0]
+    storage = CompactStorage('float32')
+    compact = storage.compact(data)
+    assert compact.dtype == np.float32
+    assert np.max(np.abs(compact.astype(np.float64) - data)) <= storage.error_bound(data)
+
+
+def test_float32_error_bound_value():
+    data = np.array([0.5, -2.0 ** 20, 3.0])
+    assert CompactStorage('float32').error_bound(data) == 2.0 ** -24 * 2 ** 20
+    assert CompactStorage('quantized', resolution=0.01).error_bound(data) == 0.005
+
+
+def test_quantized_rejects_range_beyond_float64_precision():
+    with pytest.raises(ValueError, match="2\\*\\*53"):
+        QuantizedArray.from_values(np.array([0.0, 1e10]), resolution=1e-12)
+
+    quantized = QuantizedArray.from_values(np.array([0.0, 2.0 ** 53]), resolution=1.0)
+    assert quantized.codes.dtype == np.uint64
+
+
+def test_quantized_requires_resolution():
+    with pytest.raises(ValueError):
+        CompactStorage('quantized')
+    with pytest.raises(ValueError):
+        CompactStorage('float16')
+
+
+@pytest.mark.parametrize('storage', [
+    CompactStorage('float32'),
+    CompactStorage('quantized', resolution=0.001),
+])
+def test_compare_variants_matches_full_precision(variants, storage):
+    a, b = variants
+    analyzer = CDFAnalyzer()
+    full = analyzer.compare_variants(a, b)
+    compact = analyzer.compare_variants(storage.compact(a), storage.compact(b))
+
+    bound = max(storage.error_bound(a), storage.error_bound(b))
+    np.testing.assert_allclose(compact['percentiles']['variant_a'], full['percentiles']['variant_a'], atol=bound * 2)
+    np.testing.assert_allclose(compact['percentiles']['variant_b'], full['percentiles']['variant_b'], atol=bound * 2)
+    assert compact['effect_size'] == pytest.approx(full['effect_size'], abs=1e-5)
+    assert compact['statistical_tests']['ks_test']['statistic'] == pytest.approx(
+        full['statistical_tests']['ks_test']['statistic'], abs=1e-3)
+    assert compact['statistical_tests']['mann_whitney']['p_value'] == pytest.approx(
+        full['statistical_tests']['mann_whitney']['p_value'], rel=1e-2)
+
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.cdf_calc import CDFAnalyzer
+from src.data.compact_storage import CompactStorage, QuantizedArray
+from src.data.real_world_importers import DataImporters
+
+
+def test_import_from_csv_with_compact_storage(tmp_path, variants):
+    a, b = variants
+    csv_path = tmp_path / 'experiment.csv'
+    pd.DataFrame({
+        'group': ['A'] * len(a) + ['B'] * len(b),
+        'duration': np.concatenate([a, b]),
+    }).to_csv(csv_path, index=False)
+
+    imported = DataImporters().import_from_csv(
+        str(csv_path), 'group', 'duration', storage=CompactStorage('quantized', resolution=0.001)
+    )
+    assert imported['storage'] == 'quantized'
+    assert isinstance(imported['variant_a'], QuantizedArray)
+
+    results = CDFAnalyzer().compare_variants(imported['variant_a'], imported['variant_b'])
+    assert results['variant_a']['size'] == imported['sample_sizes']['control']
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_partitioned_import_matches_single_csv(tmp_path, variants, max_workers):
+    a, b = variants
+    df = pd.DataFrame({
+        'group': ['A'] * len(a) + ['B'] * len(b),
+        'duration': np.round(np.concatenate([a, b]), 1),
+    }).sample(frac=1, random_state=0)
+    df.loc[df.index[:25], 'duration'] = np.nan
+    df.to_csv(tmp_path / 'full.csv', index=False)
+    for region, rows in enumerate(np.array_split(np.arange(len(df)), 7)):
+        partition_dir = tmp_path / 'partitions' / f'region={region}'
+        partition_dir.mkdir(parents=True)
+        df.iloc[rows].to_csv(partition_dir / 'part.csv', index=False)
+
+    importer = DataImporters()
+    single = importer.import_from_csv(str(tmp_path / 'full.csv'), 'group', 'duration')
+    sharded = importer.import_from_partitions(str(tmp_path / 'partitions'), 'group', 'duration',
+                                              max_workers=max_workers)
+
+    assert sharded['partitions'] == 7
+    assert sharded['data_quality'] == single['data_quality']
+    np.testing.assert_array_equal(sharded['variant_a'], np.sort(single['variant_a']))
+    np.testing.assert_array_equal(sharded['variant_b'], np.sort(single['variant_b']))
+    assert sharded['moments']['control']['mean'] == pytest.approx(np.mean(single['variant_a']))
+    assert sharded['moments']['treatment']['variance'] == pytest.approx(np.var(single['variant_b'], ddof=1))
+
+
+def test_partitioned_import_missing_source(tmp_path):
+    with pytest.raises(ValueError):
+        DataImporters().import_from_partitions(str(tmp_path / 'missing' / '*.csv'), 'group', 'duration')
+
+
+def test_partitioned_import_missing_variant(tmp_path):
+    pd.DataFrame({'group': ['A'] * 20, 'duration': np.arange(20.0)}).to_csv(tmp_path / 'part.csv', index=False)
+    with pytest.raises(ValueError, match="No data found for variant 'B'"):
+        DataImporters().import_from_partitions(str(tmp_path), 'group', 'duration', max_workers=1)
@@ -0,0 +1,17 @@
+from src.analysis.cdf_calc import CDFAnalyzer
+from src.analysis.segmentation import SegmentationAnalyzer
+from src.data.compact_storage import CompactStorage, QuantizedArray
+
+
+def test_segments_keep_storage_mode(variants):
+    a, b = variants
+    storage = CompactStorage('quantized', resolution=0.001)
+    base_data = {'session_duration': {'A': storage.compact(a), 'B': storage.compact(b)}}
+
+    segmenter = SegmentationAnalyzer()
+    segmented = segmenter.create_segmented_data(base_data, {})
+    for segment in segmented.values():
+        assert isinstance(segment['A'], QuantizedArray)
+
+    results = segmenter.analyze_segments(segmented, CDFAnalyzer())
+    assert set(results) == set(segmenter.segments)
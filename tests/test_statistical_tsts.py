@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from src.analysis.cdf_calc import CDFAnalyzer
+from src.analysis.time_windows import SortedWindow, TimeWindowAnalyzer, sorted_two_sample_tests
+
+
+@pytest.fixture
+def observations():
+    rng = np.random.default_rng(7)
+    n = 6000
+    timestamps = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.uniform(0, 20, n), unit='D')
+    variant = rng.choice(['A', 'B'], n)
+    # Rounded values exercise ties when days leave the window
+    value = np.round(np.where(variant == 'A', rng.exponential(120, n), rng.exponential(140, n)))
+    return pd.DataFrame({'timestamp': timestamps, 'variant': variant, 'value': value})
+
+
+def test_sorted_window_add_remove():
+    window = SortedWindow()
+    window.add(np.array([1.0, 3.0, 3.0]))
+    window.add(np.array([2.0, 3.0]))
+    window.remove(np.array([3.0, 3.0]))
+    np.testing.assert_array_equal(window.values, [1.0, 2.0, 3.0])
+    assert window.mean() == pytest.approx(2.0)
+    assert window.var() == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('window_days, step_days, n_rows', [
+    (1, 1, 6000), (7, 1, 6000), (3, 5, 6000),
+    (1, 1, 800),  # daily windows with roughly 10-30 observations per arm
+])
+def test_windows_match_compare_variants(observations, window_days, step_days, n_rows):
+    observations = observations.iloc[:n_rows]
+    table = TimeWindowAnalyzer(window_days=window_days, step_days=step_days).analyze(observations)
+    analyzer = CDFAnalyzer()
+    days = observations['timestamp'].dt.floor('D')
+
+    assert len(table) == len(range(window_days - 1, 20, step_days))
+    for row in table.itertuples():
+        in_window = observations[(days >= row.window_start) & (days <= row.window_end)]
+        a = in_window.loc[in_window['variant'] == 'A', 'value'].values
+        b = in_window.loc[in_window['variant'] == 'B', 'value'].values
+        expected = analyzer.compare_variants(a, b)
+
+        assert (row.size_a, row.size_b) == (len(a), len(b))
+        assert row.mw_statistic == pytest.approx(expected['statistical_tests']['mann_whitney']['statistic'])
+        assert row.ks_statistic == pytest.approx(expected['statistical_tests']['ks_test']['statistic'])
+        assert row.ks_p_value == pytest.approx(expected['statistical_tests']['ks_test']['p_value'])
+        assert row.mw_p_value == pytest.approx(expected['statistical_tests']['mann_whitney']['p_value'])
+        assert row.effect_size == pytest.approx(expected['effect_size'])
+        assert row.p50_a == pytest.approx(expected['percentiles']['variant_a'][2])
+        assert row.p90_b == pytest.approx(expected['percentiles']['variant_b'][4])
+
+
+@pytest.mark.parametrize('n_a, n_b', [(5, 40), (12, 12), (20, 27), (150, 160), (300, 500), (10001, 200)])
+def test_sorted_two_sample_tests_match_scipy(n_a, n_b):
+    rng = np.random.default_rng(11)
+    a = np.sort(np.round(rng.exponential(10, n_a)))
+    b = np.sort(np.round(rng.exponential(12, n_b)))
+    result = sorted_two_sample_tests(a, b)
+
+    ks = stats.ks_2samp(a, b)
+    mw = stats.mannwhitneyu(a, b, alternative='two-sided')
+    assert result['ks_statistic'] == pytest.approx(ks.statistic)
+    assert result['ks_p_value'] == pytest.approx(ks.pvalue)
+    assert result['mw_statistic'] == pytest.approx(mw.statistic)
+    assert result['mw_p_value'] == pytest.approx(mw.pvalue)
+
+
+def test_short_data_returns_empty_table(observations):
+    analyzer = TimeWindowAnalyzer(window_days=30)
+    table = analyzer.analyze(observations)
+    assert table.empty
+    assert list(table.columns) == analyzer.table_columns()
+
+
+def test_missing_columns_raise(observations):
+    with pytest.raises(ValueError):
+        TimeWindowAnalyzer().analyze(observations, metric_column='duration')